@@ -1,17 +1,18 @@
 import os
+import asyncio
+import copy
+import hashlib
+import random
+import time
 from dotenv import load_dotenv
 import google.generativeai as genai
-import pandas as pd
+from google.generativeai import client as genai_client
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
 from datetime import datetime
 import json
+import orjson
 import re
-import requests
-from bs4 import BeautifulSoup
-import gspread
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from google.auth.transport.requests import Request
-import pickle
+import aiohttp
 import os.path
 
 # Load environment variables
@@ -21,24 +22,193 @@ load_dotenv()
 genai.configure(api_key=os.getenv('GEMINI_API_KEY'))
 model = genai.GenerativeModel('models/gemini-2.5-flash-lite')
 
+# Event loop genai's cached async clients were created on
+_async_clients_loop = None
+
+# Maximum number of Gemini requests/URL fetches in flight at once
+MAX_CONCURRENCY = 10
+
+# Gemini quota (defaults match the free tier for gemini-2.5-flash-lite)
+GEMINI_RPM = int(os.getenv('GEMINI_RPM', '15'))
+GEMINI_TPM = int(os.getenv('GEMINI_TPM', '250000'))
+
+# Retry settings for rate-limited/unavailable Gemini calls
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 2.0
+RETRY_JITTER = 1.0
+
+# URL fetching: pooled connections, retried on connection/read errors and
+# rate-limit/server responses
+HTTP_POOL_SIZE = 20
+HTTP_POOL_PER_HOST = 5
+DNS_CACHE_TTL = 300
+FETCH_TIMEOUT = 10
+FETCH_RETRIES = 3
+FETCH_BACKOFF = 0.3
+FETCH_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Only the start of a page is downloaded and kept, since only
+# MAX_URL_CONTENT_CHARS of its text are analyzed
+MAX_PAGE_BYTES = 512_000
+MAX_URL_CONTENT_CHARS = 5000
+_RE_WHITESPACE = re.compile(r'\s+')
+_URL_RE = re.compile(r'^https?://').match
+
+# Bulk analysis: up to BULK_CHUNK_SIZE texts and BULK_MAX_CHARS characters per request
+BULK_CHUNK_SIZE = 8
+BULK_MAX_CHARS = 20000
+
+# Response cache: exact matches are persisted on disk; near-duplicate
+# (semantic) matches are optional and kept in memory for the current run
+CACHE_DIR = '.analyzer_cache'
+SEMANTIC_CACHE = os.getenv('ANALYZER_SEMANTIC_CACHE', '').lower() in ('1', 'true', 'yes')
+SEMANTIC_THRESHOLD = 0.95
+EMBEDDING_MODEL = 'models/text-embedding-004'
+
+_cache = None
+# {analysis_type: (cache_keys, matrix of unit-length embeddings)}
+_semantic_index = {}
+
+# Prompts and the JSON schema Gemini's structured output must follow
+_FIELD_GUIDE = (
+    'Set "analysis_type" to "{analysis_type}", "sentiment" to positive, negative or neutral, '
+    '"confidence_score" between 0 and 1, "key_points" to the main points and '
+    '"summary" to a brief summary.'
+)
+
+PROMPT_TMPL = """Analyze the following text and provide a {analysis_type} analysis.
+""" + _FIELD_GUIDE + """
+
+Text to analyze:
+{text}
+"""
+
+BULK_PROMPT_TMPL = """Analyze each of the following {count} texts and provide a {analysis_type} analysis of each.
+Return an array with exactly {count} elements, one per text, and set "text_index" to i in the analysis of TEXT_i.
+""" + _FIELD_GUIDE + """
+
+Texts to analyze:
+{texts}
+"""
+
+RESPONSE_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {
+        'analysis_type': {'type': 'STRING'},
+        'sentiment': {'type': 'STRING', 'format': 'enum', 'enum': ['positive', 'negative', 'neutral']},
+        'confidence_score': {'type': 'NUMBER'},
+        'key_points': {'type': 'ARRAY', 'items': {'type': 'STRING'}},
+        'summary': {'type': 'STRING'}
+    },
+    'required': ['analysis_type', 'sentiment', 'confidence_score', 'key_points', 'summary']
+}
+
+GENERATION_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': RESPONSE_SCHEMA
+}
+
+# Bulk items carry the index of the text they analyze so results can't be misaligned
+BULK_ITEM_SCHEMA = {
+    'type': 'OBJECT',
+    'properties': {'text_index': {'type': 'INTEGER'}, **RESPONSE_SCHEMA['properties']},
+    'required': ['text_index', *RESPONSE_SCHEMA['required']]
+}
+
+BULK_GENERATION_CONFIG = {
+    'response_mime_type': 'application/json',
+    'response_schema': {'type': 'ARRAY', 'items': BULK_ITEM_SCHEMA}
+}
+
+# Column order for exported results
+RESULT_COLUMNS = [
+    'timestamp',
+    'input_source',
+    'sentiment',
+    'confidence_score',
+    'summary',
+    'key_points',
+    'analysis_type',
+    'original_text'
+]
+
+# Rows sent per append when streaming results to Google Sheets
+SHEETS_APPEND_BATCH = 100
+
 # Google Sheets scope
 SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+TOKEN_FILE = 'token.json'
 
-def clean_json_response(text):
+_sheets_client = None
+
+def clean_json_response(text, opening='{'):
     """
     Extract and clean JSON from the response.
     Sometimes LLMs add markdown formatting or extra text.
+    
+    Returns the first balanced value starting with `opening` ('{' for an
+    object, '[' for an array) in a single pass, ignoring brackets inside
+    JSON strings.
     """
     # Remove markdown code blocks if present
-    text = re.sub(r'```json\n?', '', text)
-    text = re.sub(r'```\n?', '', text)
+    text = text.replace('```json', '').replace('```', '')
     
-    # Try to find JSON object in the text
-    json_match = re.search(r'\{.*\}', text, re.DOTALL)
-    if json_match:
-        return json_match.group()
+    # Find where the JSON starts
+    start = text.find(opening)
+    if start < 0:
+        return text.strip()
     
-    return text.strip()
+    # Walk forward until the opening bracket is balanced
+    depth = 0
+    in_str = False
+    escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_str:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_str = False
+        elif ch == '"':
+            in_str = True
+        elif ch == '{' or ch == '[':
+            depth += 1
+        elif ch == '}' or ch == ']':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    # Unbalanced: return what we have and let the JSON parser report the error
+    return text[start:].strip()
+
+def _is_url(text):
+    """Return True if the input is an http(s) URL rather than text to analyze."""
+    return _URL_RE(text) is not None
+
+def _response_text(response):
+    """
+    Return the text of the first candidate's first part ('' if there is none).
+    
+    Unlike response.text, this doesn't rebuild the string from all parts on
+    each access or raise when generation stopped for a reason other than STOP.
+    """
+    if not response.candidates or not response.candidates[0].content.parts:
+        return ''
+    return response.candidates[0].content.parts[0].text
+
+def _parse_json(text, opening='{'):
+    """
+    Parse a structured-output response, falling back to extracting the
+    JSON (starting with `opening`) from surrounding text if the model
+    didn't return bare JSON.
+    """
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch either
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return orjson.loads(clean_json_response(text, opening))
 
 def validate_inputs(inputs):
     """
@@ -60,7 +230,7 @@ def validate_inputs(inputs):
             continue
         
         # Check if it's a URL
-        if text.startswith('http://') or text.startswith('https://'):
+        if _is_url(text):
             valid_inputs.append(text)
         # Check text length
         elif len(text) < 10:
@@ -73,90 +243,489 @@ def validate_inputs(inputs):
     
     return valid_inputs, warnings
 
-def analyze_text(text, analysis_type="sentiment"):
+class TokenBucket:
     """
-    Analyze text using Gemini and return structured results.
+    Async token bucket that refills continuously at `capacity` tokens per `period` seconds.
+    """
+    
+    def __init__(self, capacity, period=60):
+        self.capacity = capacity
+        self.rate = capacity / period
+        self.level = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, amount=1):
+        """Wait until `amount` tokens are available, then take them."""
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            self._refill()
+            while self.level < amount:
+                await asyncio.sleep((amount - self.level) / self.rate)
+                self._refill()
+            self.level -= amount
+    
+    def charge(self, amount):
+        """Take tokens without waiting (the bucket may go into debt)."""
+        self._refill()
+        self.level -= amount
+
+class RateLimiter:
+    """
+    Shared limiter for Gemini calls: caps concurrency, requests per minute
+    and tokens per minute.
+    """
+    
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, rpm=GEMINI_RPM, tpm=GEMINI_TPM):
+        self.max_concurrency = max_concurrency
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+    
+    async def acquire(self, prompt):
+        """
+        Reserve one request and an estimated token count for a prompt.
+        
+        Returns:
+            The number of tokens reserved
+        """
+        estimate = max(len(prompt) // 4, 1)
+        await self.requests.acquire()
+        await self.tokens.acquire(estimate)
+        return estimate
+    
+    def reconcile(self, estimate, response):
+        """Charge the difference between the estimate and the API's reported usage."""
+        usage = getattr(response, 'usage_metadata', None)
+        actual = getattr(usage, 'total_token_count', 0) if usage else 0
+        if actual > estimate:
+            self.tokens.charge(actual - estimate)
+
+# One limiter per process so quota used by earlier calls counts against later ones
+_rate_limiter = RateLimiter()
+_rate_limiter_loop = None
+
+def _bind_rate_limiter_to_running_loop():
+    """
+    Return the shared RateLimiter, recreating its lock and semaphore if they
+    belong to another event loop.
+    
+    Only the loop-bound primitives are replaced; bucket levels carry over, so
+    back-to-back asyncio.run calls still share the same RPM/TPM budget.
+    """
+    global _rate_limiter_loop
+    loop = asyncio.get_running_loop()
+    if _rate_limiter_loop is not loop:
+        _rate_limiter.semaphore = asyncio.Semaphore(_rate_limiter.max_concurrency)
+        _rate_limiter.requests.lock = asyncio.Lock()
+        _rate_limiter.tokens.lock = asyncio.Lock()
+        _rate_limiter_loop = loop
+    return _rate_limiter
+
+def _bind_async_clients_to_running_loop():
+    """
+    Drop genai's cached async clients if they were created on another event loop.
+    
+    The gRPC channel behind generate_content_async/embed_content_async is
+    created on first use and stays bound to that loop, so without this a
+    second asyncio.run in the same process (e.g. analyze_text followed by
+    analyze_batch) fails with "Event loop is closed".
+    """
+    global _async_clients_loop
+    loop = asyncio.get_running_loop()
+    if _async_clients_loop is not loop:
+        model._async_client = None
+        genai_client._client_manager.clients.pop('generative_async', None)
+        _async_clients_loop = loop
+
+async def call_with_retry(prompt, limiter, generation_config=None, max_attempts=MAX_RETRIES):
+    """
+    Call Gemini under the rate limiter, retrying quota/availability errors
+    with exponential backoff.
     
     Args:
-        text: The text to analyze
-        analysis_type: Type of analysis (sentiment, summary, keywords, etc.)
+        prompt: The prompt to send
+        limiter: Shared RateLimiter
+        generation_config: Optional Gemini generation config (e.g. a response schema)
+        max_attempts: Maximum number of attempts before giving up
     
     Returns:
-        Dictionary with analysis results
+        The Gemini response
     """
+    _bind_async_clients_to_running_loop()
     
-    # Create a prompt that asks for structured output
-    prompt = f"""
-    Analyze the following text and provide a {analysis_type} analysis.
+    for attempt in range(max_attempts):
+        estimate = await limiter.acquire(prompt)
+        try:
+            async with limiter.semaphore:
+                response = await model.generate_content_async(prompt, generation_config=generation_config)
+        except (ResourceExhausted, ServiceUnavailable) as e:
+            if attempt == max_attempts - 1:
+                raise
+            delay = RETRY_BASE_DELAY * 2 ** attempt + random.uniform(0, RETRY_JITTER)
+            print(f"⏳ {type(e).__name__}, retrying in {delay:.1f}s (attempt {attempt + 2}/{max_attempts})")
+            await asyncio.sleep(delay)
+            continue
+        
+        limiter.reconcile(estimate, response)
+        return response
+
+def _get_cache():
+    """Open the on-disk response cache on first use."""
+    global _cache
+    if _cache is None:
+        import diskcache
+        _cache = diskcache.Cache(CACHE_DIR)
+    return _cache
+
+def _cache_key(text, analysis_type):
+    return hashlib.blake2b((analysis_type + "\x00" + text).encode(), digest_size=16).hexdigest()
+
+async def _embed(text):
+    """
+    Embed text for the semantic cache.
     
-    Return your response in this exact JSON format:
-    {{
-        "analysis_type": "{analysis_type}",
-        "sentiment": "positive/negative/neutral",
-        "confidence_score": 0.85,
-        "key_points": ["point1", "point2", "point3"],
-        "summary": "brief summary here"
-    }}
+    Returns:
+        Unit-length embedding vector or None if embedding failed
+    """
+    import numpy as np
     
-    Text to analyze:
-    {text}
+    _bind_async_clients_to_running_loop()
     
-    IMPORTANT: Return ONLY valid JSON, no other text or markdown formatting.
+    try:
+        response = await genai.embed_content_async(model=EMBEDDING_MODEL, content=text)
+        vector = np.asarray(response['embedding'], dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+    except Exception as e:
+        print(f"⚠️  Embedding failed, skipping semantic cache: {e}")
+        return None
+
+def _semantic_lookup(vector, analysis_type):
     """
+    Find the cached result whose text is most similar to `vector`.
+    
+    Returns:
+        Cached result or None if nothing is above SEMANTIC_THRESHOLD
+    """
+    import numpy as np
+    
+    if analysis_type not in _semantic_index:
+        return None
+    
+    keys, matrix = _semantic_index[analysis_type]
+    similarities = matrix @ vector
+    best = int(np.argmax(similarities))
+    if similarities[best] < SEMANTIC_THRESHOLD:
+        return None
+    return _get_cache().get(keys[best])
+
+def _semantic_add(key, vector, analysis_type):
+    import numpy as np
+    
+    if analysis_type in _semantic_index:
+        keys, matrix = _semantic_index[analysis_type]
+        _semantic_index[analysis_type] = (keys + [key], np.vstack([matrix, vector]))
+    else:
+        _semantic_index[analysis_type] = ([key], vector[np.newaxis, :])
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _with_metadata(result, text, timestamp):
+    """Return a copy of a (possibly cached) result with per-call metadata added."""
+    result = copy.deepcopy(result)
+    result['original_text'] = text[:100] + "..." if len(text) > 100 else text
+    result['timestamp'] = timestamp
+    return result
+
+async def _lookup_cached(text, analysis_type, semantic):
+    """
+    Look up a cached analysis for a text.
+    
+    Returns:
+        Tuple of (cached_result, cache_key, embedding); cached_result is None on a miss
+    """
+    key = _cache_key(text, analysis_type)
+    cached = _get_cache().get(key)
+    if cached is not None:
+        print("💾 Using cached analysis")
+        return cached, key, None
+    
+    vector = None
+    if semantic:
+        vector = await _embed(text)
+        if vector is not None:
+            cached = _semantic_lookup(vector, analysis_type)
+            if cached is not None:
+                print("💾 Using cached analysis of a near-identical text")
+    
+    return cached, key, vector
+
+def _store_cached(result, key, vector, analysis_type):
+    # Cache the bare analysis, before per-call metadata is added
+    _get_cache().set(key, result)
+    if vector is not None:
+        _semantic_add(key, vector, analysis_type)
+
+async def _analyze_uncached(text, key, vector, limiter, analysis_type, timestamp):
+    """
+    Analyze a single text with Gemini and cache the result.
+    
+    Returns:
+        Dictionary with analysis results or None if failed
+    """
+    prompt = PROMPT_TMPL.format(analysis_type=analysis_type, text=text)
     
     try:
         print(f"🔍 Analyzing text...")
-        response = model.generate_content(prompt)
-        
-        # Clean and parse the JSON response
-        cleaned_response = clean_json_response(response.text)
-        result = json.loads(cleaned_response)
+        response = await call_with_retry(prompt, limiter, GENERATION_CONFIG)
+        raw = _response_text(response)
+        result = _parse_json(raw)
         
-        # Add metadata
-        result['original_text'] = text[:100] + "..." if len(text) > 100 else text
-        result['timestamp'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        _store_cached(result, key, vector, analysis_type)
         
         print("✅ Analysis complete!")
-        return result
+        return _with_metadata(result, text, timestamp)
         
     except json.JSONDecodeError as e:
         print(f"❌ Error parsing JSON: {e}")
-        print(f"Raw response: {response.text}")
+        print(f"Raw response: {raw}")
         return None
     except Exception as e:
         print(f"❌ Error during analysis: {e}")
         return None
 
-def fetch_url_content(url):
+async def analyze_text_async(text, analysis_type="sentiment", *, limiter=None, semantic=SEMANTIC_CACHE,
+                             timestamp=None):
+    """
+    Analyze text using Gemini and return structured results.
+    
+    Results are cached by (analysis_type, text); with `semantic` enabled,
+    near-identical texts also reuse a cached result.
+    
+    Args:
+        text: The text to analyze
+        analysis_type: Type of analysis (sentiment, summary, keywords, etc.)
+        limiter: RateLimiter to use (defaults to the process-wide limiter)
+        semantic: Whether to look up near-duplicate texts in the semantic cache
+        timestamp: Timestamp to record on the result (defaults to now)
+    
+    Returns:
+        Dictionary with analysis results
+    """
+    if timestamp is None:
+        timestamp = _now()
+    
+    cached, key, vector = await _lookup_cached(text, analysis_type, semantic)
+    if cached is not None:
+        return _with_metadata(cached, text, timestamp)
+    
+    if limiter is None:
+        limiter = _bind_rate_limiter_to_running_loop()
+    
+    return await _analyze_uncached(text, key, vector, limiter, analysis_type, timestamp)
+
+async def analyze_texts_bulk(texts, analysis_type="sentiment", *, limiter=None, semantic=SEMANTIC_CACHE,
+                             timestamp=None):
+    """
+    Analyze several texts with a single Gemini request.
+    
+    Cached texts are answered from the cache and the rest are packed into one
+    prompt asking for a JSON array. If the response doesn't line up with the
+    texts, each text is analyzed on its own instead.
+    
+    Args:
+        texts: List of texts to analyze together
+        analysis_type: Type of analysis (sentiment, summary, keywords, etc.)
+        limiter: RateLimiter to use (defaults to the process-wide limiter)
+        semantic: Whether to look up near-duplicate texts in the semantic cache
+        timestamp: Timestamp to record on the results (defaults to now)
+    
+    Returns:
+        List of analysis results (None for failed items), aligned with texts
+    """
+    if limiter is None:
+        limiter = _bind_rate_limiter_to_running_loop()
+    if timestamp is None:
+        timestamp = _now()
+    
+    lookups = await asyncio.gather(*(_lookup_cached(text, analysis_type, semantic) for text in texts))
+    results = [
+        None if cached is None else _with_metadata(cached, text, timestamp)
+        for text, (cached, _, _) in zip(texts, lookups)
+    ]
+    pending = [i for i, result in enumerate(results) if result is None]
+    
+    async def analyze_individually(indices):
+        outcomes = await asyncio.gather(*(
+            _analyze_uncached(texts[i], lookups[i][1], lookups[i][2], limiter, analysis_type, timestamp)
+            for i in indices
+        ))
+        for i, outcome in zip(indices, outcomes):
+            results[i] = outcome
+        return results
+    
+    if len(pending) <= 1:
+        return await analyze_individually(pending)
+    
+    numbered_texts = "\n\n".join(f"TEXT_{n}:\n{texts[i]}" for n, i in enumerate(pending))
+    prompt = BULK_PROMPT_TMPL.format(analysis_type=analysis_type, count=len(pending), texts=numbered_texts)
+    
+    try:
+        print(f"🔍 Analyzing {len(pending)} texts in one request...")
+        response = await call_with_retry(prompt, limiter, BULK_GENERATION_CONFIG)
+        analyses = _parse_json(_response_text(response), opening='[')
+    except json.JSONDecodeError as e:
+        print(f"❌ Error parsing JSON: {e}")
+        analyses = None
+    except Exception as e:
+        print(f"❌ Error during analysis: {e}")
+        return results
+    
+    # Map results by the text_index the model echoed back; anything other than
+    # exactly one result per text falls back to individual requests
+    by_index = {}
+    if (isinstance(analyses, list) and len(analyses) == len(pending)
+            and all(isinstance(analysis, dict) for analysis in analyses)):
+        by_index = {analysis.pop('text_index', None): analysis for analysis in analyses}
+    
+    if set(by_index) != set(range(len(pending))):
+        print("⚠️  Bulk response didn't match the inputs, analyzing them individually")
+        return await analyze_individually(pending)
+    
+    for n, i in enumerate(pending):
+        analysis = by_index[n]
+        _, key, vector = lookups[i]
+        _store_cached(analysis, key, vector, analysis_type)
+        results[i] = _with_metadata(analysis, texts[i], timestamp)
+    
+    print(f"✅ Analysis of {len(pending)} texts complete!")
+    return results
+
+def analyze_text(text, analysis_type="sentiment"):
+    """
+    Analyze a single text using Gemini (blocking wrapper around analyze_text_async).
+    
+    Args:
+        text: The text to analyze
+        analysis_type: Type of analysis (sentiment, summary, keywords, etc.)
+    
+    Returns:
+        Dictionary with analysis results
+    """
+    return asyncio.run(analyze_text_async(text, analysis_type=analysis_type))
+
+def _make_resolver():
+    """
+    Use the non-blocking c-ares resolver when aiodns is installed, otherwise
+    aiohttp's default thread-pool resolver.
+    """
+    try:
+        import aiodns  # noqa: F401
+    except ImportError:
+        return None
+    return aiohttp.AsyncResolver()
+
+def _make_http_session():
+    """
+    Create the pooled HTTP session used for URL fetches.
+    
+    aiohttp sessions are bound to the event loop they were created in, so
+    each batch opens one session and shares it across all of its fetches.
+    Each hostname is resolved once per batch: lookups are cached for
+    DNS_CACHE_TTL seconds and concurrent lookups of the same host are
+    coalesced by the connector.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_POOL_SIZE,
+        limit_per_host=HTTP_POOL_PER_HOST,
+        resolver=_make_resolver(),
+        use_dns_cache=True,
+        ttl_dns_cache=DNS_CACHE_TTL
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={'User-Agent': 'Mozilla/5.0'},
+        # Per-socket timeouts only: a total timeout would also count time spent
+        # queued for a pooled connection to a busy host
+        timeout=aiohttp.ClientTimeout(total=None, sock_connect=FETCH_TIMEOUT, sock_read=FETCH_TIMEOUT)
+    )
+
+def _extract_text(html, charset=None):
+    """
+    Extract readable text from an HTML document.
+    
+    Args:
+        html: Raw HTML bytes
+        charset: Encoding declared by the server, if any
+    
+    Returns:
+        Whitespace-collapsed text, truncated to MAX_URL_CONTENT_CHARS
+    """
+    from bs4 import BeautifulSoup
+    
+    # Parse HTML
+    soup = BeautifulSoup(html, 'lxml', from_encoding=charset)
+    
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+    
+    # Get text, collapse whitespace and limit length for analysis (Gemini has token limits)
+    text = _RE_WHITESPACE.sub(' ', soup.get_text(separator=' ')).strip()
+    return text[:MAX_URL_CONTENT_CHARS]
+
+async def _read_capped(response, limit):
+    """Read at most `limit` bytes of a response body, leaving the rest undownloaded."""
+    chunks = []
+    remaining = limit
+    while remaining > 0:
+        chunk = await response.content.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b''.join(chunks)
+
+async def fetch_url_content_async(url, session, sem):
     """
     Fetch and extract main text content from a URL.
     
     Args:
         url: The URL to fetch
+        session: Shared session from _make_http_session()
+        sem: asyncio.Semaphore limiting concurrent fetches
     
     Returns:
         Extracted text content or None if failed
     """
     try:
         print(f"🌐 Fetching content from: {url}")
-        headers = {'User-Agent': 'Mozilla/5.0'}
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        # Parse HTML
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text
-        text = soup.get_text()
+        async with sem:
+            for attempt in range(FETCH_RETRIES + 1):
+                last_attempt = attempt == FETCH_RETRIES
+                try:
+                    async with session.get(url) as response:
+                        if response.status not in FETCH_RETRY_STATUSES or last_attempt:
+                            response.raise_for_status()
+                            html = await _read_capped(response, MAX_PAGE_BYTES)
+                            charset = response.charset
+                            break
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                    if last_attempt:
+                        raise
+                # Back off outside the response block so the connection goes back to the pool
+                await asyncio.sleep(FETCH_BACKOFF * 2 ** attempt)
         
-        # Clean up whitespace
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
+        # Parsing is CPU-bound, so run it in a worker thread to keep other fetches and
+        # Gemini calls moving on the event loop
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(None, _extract_text, html, charset)
         
         print(f"✅ Fetched {len(text)} characters")
         return text
@@ -165,16 +734,36 @@ def fetch_url_content(url):
         print(f"❌ Error fetching URL: {e}")
         return None
 
-def analyze_batch(inputs, analysis_type="sentiment"):
+def _chunk_items(items, chunk_size, max_chars=BULK_MAX_CHARS):
     """
-    Analyze multiple texts or URLs in batch.
+    Group (source, content) items for bulk analysis.
     
-    Args:
-        inputs: List of texts or URLs to analyze
-        analysis_type: Type of analysis to perform
+    Each chunk holds at most chunk_size items and max_chars characters of
+    content; an item longer than max_chars gets a chunk to itself.
+    """
+    chunks = []
+    current = []
+    current_chars = 0
     
-    Returns:
-        List of analysis results
+    for item in items:
+        content_chars = len(item[1])
+        if current and (len(current) == chunk_size or current_chars + content_chars > max_chars):
+            chunks.append(current)
+            current = []
+            current_chars = 0
+        current.append(item)
+        current_chars += content_chars
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+async def _iter_batch(inputs, analysis_type, max_concurrency, chunk_size):
+    """
+    Run a batch and yield (position, result) pairs as each Gemini request completes.
+    
+    position is the item's index among the validated inputs, so callers can
+    restore input order.
     """
     # Validate inputs first
     valid_inputs, warnings = validate_inputs(inputs)
@@ -187,50 +776,157 @@ def analyze_batch(inputs, analysis_type="sentiment"):
     
     if not valid_inputs:
         print("❌ No valid inputs to process")
-        return []
-    
-    results = []
-    
-    for i, input_text in enumerate(valid_inputs, 1):
-        print(f"\n{'='*50}")
-        print(f"Processing item {i}/{len(valid_inputs)}")
-        print(f"{'='*50}")
-        
-        # Check if input is a URL
-        if input_text.startswith('http://') or input_text.startswith('https://'):
-            content = fetch_url_content(input_text)
-            if not content:
-                print("⚠️  Skipping this URL due to fetch error")
-                continue
-            # Limit content length for analysis (Gemini has token limits)
-            content = content[:5000]
-        else:
-            content = input_text
-        
-        # Analyze the content
-        result = analyze_text(content, analysis_type)
+        return
+    
+    # Analyze each distinct input once and copy its result to any duplicates
+    positions = {}
+    for i, input_text in enumerate(valid_inputs):
+        positions.setdefault(input_text, []).append(i)
+    unique_inputs = list(positions)
+    if len(unique_inputs) < len(valid_inputs):
+        print(f"Skipping {len(valid_inputs) - len(unique_inputs)} duplicate input(s)")
+    
+    print(f"Processing {len(unique_inputs)} item(s) with up to {max_concurrency} concurrent requests")
+    
+    sem = asyncio.Semaphore(max_concurrency)
+    limiter = _bind_rate_limiter_to_running_loop()
+    
+    # Fetch all URLs first so their content can be packed into bulk requests
+    urls = [text for text in unique_inputs if _is_url(text)]
+    async with _make_http_session() as session:
+        fetched = await asyncio.gather(*(fetch_url_content_async(url, session, sem) for url in urls))
+    url_contents = dict(zip(urls, fetched))
+    
+    text_items = []
+    url_items = []
+    
+    for input_text in unique_inputs:
+        if input_text not in url_contents:
+            text_items.append((input_text, input_text))
+            continue
         
-        if result:
-            result['input_source'] = input_text
-            results.append(result)
+        content = url_contents[input_text]
+        if not content:
+            print(f"⚠️  Skipping {input_text} due to fetch error")
+            continue
+        url_items.append((input_text, content))
     
-    return results
+    # Every result in the batch shares one timestamp
+    batch_timestamp = _now()
+    
+    async def analyze_chunk(chunk, semantic):
+        try:
+            async with sem:
+                outcome = await analyze_texts_bulk(
+                    [content for _, content in chunk], analysis_type,
+                    limiter=limiter, semantic=semantic, timestamp=batch_timestamp
+                )
+        except Exception as e:
+            print(f"❌ Error processing {len(chunk)} item(s): {e}")
+            outcome = [None] * len(chunk)
+        return chunk, outcome
+    
+    # Page content changes between fetches, so only exact matches are reused for URLs
+    tasks = [
+        asyncio.ensure_future(analyze_chunk(chunk, semantic))
+        for items, semantic in ((text_items, SEMANTIC_CACHE), (url_items, False))
+        for chunk in _chunk_items(items, chunk_size)
+    ]
+    
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            chunk, outcome = await next_done
+            for (input_text, _), result in zip(chunk, outcome):
+                if not result:
+                    continue
+                result['input_source'] = input_text
+                for n, position in enumerate(positions[input_text]):
+                    yield position, (result if n == 0 else copy.deepcopy(result))
+    finally:
+        # Stop outstanding requests if the consumer stops early
+        for task in tasks:
+            task.cancel()
 
-def export_to_excel(results, filename=None):
+async def stream_batch(inputs, analysis_type="sentiment", max_concurrency=MAX_CONCURRENCY,
+                       chunk_size=BULK_CHUNK_SIZE):
     """
-    Export analysis results to an Excel file.
+    Analyze multiple texts or URLs, yielding each result as soon as it's ready.
     
     Args:
-        results: List of analysis result dictionaries
-        filename: Output filename (optional, auto-generates if not provided)
+        inputs: List of texts or URLs to analyze
+        analysis_type: Type of analysis to perform
+        max_concurrency: Maximum number of requests in flight at once
+        chunk_size: Maximum number of texts packed into one Gemini request
+    
+    Yields:
+        Analysis result dictionaries, in completion order
+    """
+    async for _, result in _iter_batch(inputs, analysis_type, max_concurrency, chunk_size):
+        yield result
+
+async def analyze_batch_async(inputs, analysis_type="sentiment", max_concurrency=MAX_CONCURRENCY,
+                              chunk_size=BULK_CHUNK_SIZE):
+    """
+    Analyze multiple texts or URLs concurrently.
+    
+    Args:
+        inputs: List of texts or URLs to analyze
+        analysis_type: Type of analysis to perform
+        max_concurrency: Maximum number of requests in flight at once
+        chunk_size: Maximum number of texts packed into one Gemini request
     
     Returns:
-        The filename that was created
+        List of analysis results, in input order
     """
-    if not results:
-        print("❌ No results to export")
-        return None
+    indexed_results = [pair async for pair in _iter_batch(inputs, analysis_type, max_concurrency, chunk_size)]
+    indexed_results.sort(key=lambda pair: pair[0])
+    return [result for _, result in indexed_results]
+
+def analyze_batch(inputs, analysis_type="sentiment", max_concurrency=MAX_CONCURRENCY,
+                  chunk_size=BULK_CHUNK_SIZE):
+    """
+    Analyze multiple texts or URLs in batch.
     
+    Args:
+        inputs: List of texts or URLs to analyze
+        analysis_type: Type of analysis to perform
+        max_concurrency: Maximum number of requests in flight at once
+        chunk_size: Maximum number of texts packed into one Gemini request
+    
+    Returns:
+        List of analysis results
+    """
+    return asyncio.run(analyze_batch_async(inputs, analysis_type, max_concurrency, chunk_size))
+
+def _results_to_dataframe(results):
+    """
+    Build the export DataFrame from analysis results.
+    
+    Columns follow RESULT_COLUMNS (skipping any the results don't have) and
+    key_points lists are flattened into "point1 | point2" strings.
+    """
+    import pandas as pd
+    
+    # Only include columns that exist, building each one directly from the results
+    columns = [col for col in RESULT_COLUMNS if any(col in result for result in results)]
+    df = pd.DataFrame({col: [result.get(col) for result in results] for col in columns}, copy=False)
+    
+    # Flatten the key_points lists into strings
+    if 'key_points' in df.columns:
+        is_list = df['key_points'].map(lambda value: isinstance(value, list))
+        df.loc[is_list, 'key_points'] = df.loc[is_list, 'key_points'].map(' | '.join)
+    
+    return df
+
+def _result_row(result):
+    """Flatten one result into a row of RESULT_COLUMNS values."""
+    row = [result.get(col) for col in RESULT_COLUMNS]
+    key_points = RESULT_COLUMNS.index('key_points')
+    if isinstance(row[key_points], list):
+        row[key_points] = ' | '.join(row[key_points])
+    return row
+
+def _excel_filename(filename):
     # Auto-generate filename if not provided
     if not filename:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -240,49 +936,62 @@ def export_to_excel(results, filename=None):
     if not filename.endswith('.xlsx'):
         filename += '.xlsx'
     
+    return filename
+
+def export_to_excel(results, filename=None):
+    """
+    Export analysis results to an Excel file.
+    
+    Args:
+        results: List of analysis result dictionaries
+        filename: Output filename (optional, auto-generates if not provided)
+    
+    Returns:
+        The filename that was created
+    """
+    import pandas as pd
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    
+    if not results:
+        print("❌ No results to export")
+        return None
+    
+    filename = _excel_filename(filename)
+    
     try:
         print(f"\n📝 Exporting results to Excel...")
         
         # Convert results to DataFrame
-        # Flatten the key_points list into a string for Excel
-        for result in results:
-            if 'key_points' in result and isinstance(result['key_points'], list):
-                result['key_points'] = ' | '.join(result['key_points'])
-        
-        df = pd.DataFrame(results)
-        
-        # Reorder columns for better readability
-        desired_order = [
-            'timestamp',
-            'input_source', 
-            'sentiment',
-            'confidence_score',
-            'summary',
-            'key_points',
-            'analysis_type',
-            'original_text'
-        ]
-        
-        # Only include columns that exist
-        columns = [col for col in desired_order if col in df.columns]
-        df = df[columns]
-        
-        # Create Excel writer with formatting
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='Analysis Results', index=False)
-            
-            # Get the worksheet
-            worksheet = writer.sheets['Analysis Results']
-            
-            # Adjust column widths
-            for idx, col in enumerate(df.columns, 1):
-                max_length = max(
-                    df[col].astype(str).apply(len).max(),
-                    len(col)
-                )
-                # Cap at 50 characters for readability
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[chr(64 + idx)].width = adjusted_width
+        df = _results_to_dataframe(results)
+        
+        # Write-only workbooks stream rows to disk instead of building a cell object per value
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Analysis Results')
+        
+        # Adjust column widths (must be set before any rows are written)
+        max_lengths = df.astype(str).apply(lambda values: values.str.len().max())
+        header_lengths = pd.Series({col: len(col) for col in df.columns})
+        # Cap at 50 characters for readability
+        widths = (pd.concat([max_lengths, header_lengths], axis=1).max(axis=1) + 2).clip(upper=50)
+        for idx, col in enumerate(df.columns, 1):
+            worksheet.column_dimensions[get_column_letter(idx)].width = int(widths[col])
+        
+        # Bold header row, then the data (missing values become empty cells)
+        header = []
+        for col in df.columns:
+            cell = WriteOnlyCell(worksheet, value=col)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        worksheet.append(header)
+        
+        values = df.astype(object).where(df.notna(), None)
+        for row in values.itertuples(index=False, name=None):
+            worksheet.append(row)
+        
+        workbook.save(filename)
         
         print(f"Results exported to: {filename}")
         print(f"Total rows: {len(df)}")
@@ -292,19 +1001,94 @@ def export_to_excel(results, filename=None):
         print(f"❌ Error exporting to Excel: {e}")
         return None
 
+async def export_to_excel_streaming(results, filename=None):
+    """
+    Export analysis results to an Excel file as they arrive.
+    
+    Rows are appended to a write-only workbook as soon as each result is
+    yielded, so the full batch is never held in memory.
+    
+    Args:
+        results: Async iterator of analysis results (e.g. from stream_batch)
+        filename: Output filename (optional, auto-generates if not provided)
+    
+    Returns:
+        The filename that was created
+    """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    from openpyxl.utils import get_column_letter
+    
+    filename = _excel_filename(filename)
+    
+    try:
+        print(f"\n📝 Streaming results to Excel...")
+        
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet('Analysis Results')
+        
+        # Values aren't known up front: free-text columns get the usual 50-character cap,
+        # timestamp fits a formatted timestamp and the rest fit their header
+        for idx, col in enumerate(RESULT_COLUMNS, 1):
+            if col in ('input_source', 'summary', 'key_points', 'original_text'):
+                width = 50
+            elif col == 'timestamp':
+                width = len(_now()) + 2
+            else:
+                width = len(col) + 2
+            worksheet.column_dimensions[get_column_letter(idx)].width = width
+        
+        header = []
+        for col in RESULT_COLUMNS:
+            cell = WriteOnlyCell(worksheet, value=col)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        worksheet.append(header)
+        
+        rows = 0
+        async for result in results:
+            worksheet.append(_result_row(result))
+            rows += 1
+        
+        if not rows:
+            print("❌ No results to export")
+            return None
+        
+        workbook.save(filename)
+        
+        print(f"Results exported to: {filename}")
+        print(f"Total rows: {rows}")
+        return filename
+        
+    except Exception as e:
+        print(f"❌ Error exporting to Excel: {e}")
+        return None
+
 def authenticate_google_sheets():
     """
     Authenticate with Google Sheets API.
     
+    The authorized client is reused for the rest of the process.
+    
     Returns:
         Authenticated gspread client or None if failed
     """
+    import gspread
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+    
+    global _sheets_client
+    if _sheets_client is not None:
+        return _sheets_client
+    
     creds = None
     
     # Token file stores the user's access and refresh tokens
-    if os.path.exists('token.pickle'):
-        with open('token.pickle', 'rb') as token:
-            creds = pickle.load(token)
+    if os.path.exists(TOKEN_FILE):
+        with open(TOKEN_FILE, 'r') as token:
+            creds = Credentials.from_authorized_user_info(json.load(token), SCOPES)
     
     # If no valid credentials, let user log in
     if not creds or not creds.valid:
@@ -321,16 +1105,47 @@ def authenticate_google_sheets():
             creds = flow.run_local_server(port=0)
         
         # Save credentials for next run
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
+        with open(TOKEN_FILE, 'w') as token:
+            token.write(creds.to_json())
     
     try:
-        client = gspread.authorize(creds)
-        return client
+        _sheets_client = gspread.authorize(creds)
+        return _sheets_client
     except Exception as e:
         print(f"❌ Authentication error: {e}")
         return None
 
+def _header_format_requests(worksheet, num_columns):
+    """Sheets batch_update requests that style the header row and auto-resize columns."""
+    return [
+        {
+            'repeatCell': {
+                'range': {
+                    'sheetId': worksheet.id,
+                    'startRowIndex': 0,
+                    'endRowIndex': 1,
+                    'startColumnIndex': 0,
+                    'endColumnIndex': num_columns
+                },
+                'cell': {'userEnteredFormat': {
+                    "backgroundColor": {"red": 0.2, "green": 0.2, "blue": 0.8},
+                    "textFormat": {"foregroundColor": {"red": 1, "green": 1, "blue": 1}, "bold": True}
+                }},
+                'fields': 'userEnteredFormat(backgroundColor,textFormat)'
+            }
+        },
+        {
+            'autoResizeDimensions': {
+                'dimensions': {
+                    'sheetId': worksheet.id,
+                    'dimension': 'COLUMNS',
+                    'startIndex': 0,
+                    'endIndex': num_columns
+                }
+            }
+        }
+    ]
+
 def export_to_google_sheets(results, sheet_name=None):
     """
     Export analysis results to Google Sheets.
@@ -342,6 +1157,8 @@ def export_to_google_sheets(results, sheet_name=None):
     Returns:
         The URL of the created sheet or None if failed
     """
+    from openpyxl.utils import get_column_letter
+    
     if not results:
         print("❌ No results to export")
         return None
@@ -364,49 +1181,106 @@ def export_to_google_sheets(results, sheet_name=None):
         spreadsheet = client.create(sheet_name)
         worksheet = spreadsheet.sheet1
         
-        # Prepare data for Google Sheets
-        # Flatten key_points list into string
-        for result in results:
-            if 'key_points' in result and isinstance(result['key_points'], list):
-                result['key_points'] = ' | '.join(result['key_points'])
-        
         # Convert to DataFrame
-        df = pd.DataFrame(results)
-        
-        # Reorder columns
-        desired_order = [
-            'timestamp',
-            'input_source', 
-            'sentiment',
-            'confidence_score',
-            'summary',
-            'key_points',
-            'analysis_type',
-            'original_text'
-        ]
-        
-        columns = [col for col in desired_order if col in df.columns]
-        df = df[columns]
-        
-        # Prepare data for sheets (headers + rows)
+        df = _results_to_dataframe(results)
+        
+        # Prepare data for sheets (headers + rows, missing values left blank)
         headers = df.columns.tolist()
-        data = df.values.tolist()
+        data = df.astype(object).where(df.notna(), '').values.tolist()
+        values = [headers] + data
         
-        # Write headers
-        worksheet.update('A1', [headers])
+        # Write headers and data in a single request
+        worksheet.update(
+            values=values,
+            range_name=f'A1:{get_column_letter(len(headers))}{len(values)}',
+            value_input_option='RAW'
+        )
         
-        # Write data
-        if data:
-            worksheet.update(f'A2', data)
+        # Format the header row and auto-resize columns in a single request
+        spreadsheet.batch_update({'requests': _header_format_requests(worksheet, len(headers))})
         
-        # Format the sheet
-        worksheet.format('A1:Z1', {
-            "backgroundColor": {"red": 0.2, "green": 0.2, "blue": 0.8},
-            "textFormat": {"foregroundColor": {"red": 1, "green": 1, "blue": 1}, "bold": True}
-        })
+        # Share the sheet (make it accessible via link)
+        spreadsheet.share('', perm_type='anyone', role='reader')
         
-        # Auto-resize columns
-        worksheet.columns_auto_resize(0, len(headers))
+        sheet_url = spreadsheet.url
+        
+        print(f"✅ Results exported to Google Sheets!")
+        print(f"📊 Total rows: {len(df)}")
+        print(f"🔗 Sheet URL: {sheet_url}")
+        
+        return sheet_url
+        
+    except Exception as e:
+        print(f"❌ Error exporting to Google Sheets: {e}")
+        return None
+
+async def export_to_google_sheets_streaming(results, sheet_name=None):
+    """
+    Export analysis results to Google Sheets as they arrive.
+    
+    Rows are appended in batches of SHEETS_APPEND_BATCH, so rows written
+    before a failure are kept in the sheet.
+    
+    Args:
+        results: Async iterator of analysis results (e.g. from stream_batch)
+        sheet_name: Name for the Google Sheet (optional)
+    
+    Returns:
+        The URL of the created sheet or None if failed
+    """
+    # Auto-generate sheet name if not provided
+    if not sheet_name:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        sheet_name = f"Analysis Results {timestamp}"
+    
+    try:
+        print(f"\n📝 Authenticating with Google...")
+        client = authenticate_google_sheets()
+        
+        if not client:
+            return None
+        
+        # gspread is blocking, so its calls run in a worker thread while analysis continues
+        loop = asyncio.get_running_loop()
+        spreadsheet = None
+        
+        async def create():
+            print(f"📝 Creating Google Sheet: {sheet_name}")
+            spreadsheet = await loop.run_in_executor(None, client.create, sheet_name)
+            await loop.run_in_executor(
+                None, lambda: spreadsheet.sheet1.update(
+                    values=[RESULT_COLUMNS], range_name='A1', value_input_option='RAW'
+                )
+            )
+            return spreadsheet
+        
+        async def append(rows):
+            await loop.run_in_executor(
+                None, lambda: worksheet.append_rows(rows, value_input_option='RAW')
+            )
+        
+        pending = []
+        total = 0
+        async for result in results:
+            # Create the sheet on the first result so an empty batch doesn't publish an empty sheet
+            if spreadsheet is None:
+                spreadsheet = await create()
+                worksheet = spreadsheet.sheet1
+            pending.append(_result_row(result))
+            if len(pending) >= SHEETS_APPEND_BATCH:
+                await append(pending)
+                total += len(pending)
+                pending = []
+        
+        if pending:
+            await append(pending)
+            total += len(pending)
+        
+        if spreadsheet is None:
+            print("❌ No results to export")
+            return None
+        
+        spreadsheet.batch_update({'requests': _header_format_requests(worksheet, len(RESULT_COLUMNS))})
         
         # Share the sheet (make it accessible via link)
         spreadsheet.share('', perm_type='anyone', role='reader')
@@ -414,7 +1288,7 @@ def export_to_google_sheets(results, sheet_name=None):
         sheet_url = spreadsheet.url
         
         print(f"✅ Results exported to Google Sheets!")
-        print(f"📊 Total rows: {len(df)}")
+        print(f"📊 Total rows: {total}")
         print(f"🔗 Sheet URL: {sheet_url}")
         
         return sheet_url
@@ -433,7 +1307,7 @@ if __name__ == "__main__":
     ]
     
     print("🚀 Starting batch analysis...\n")
-    results = analyze_batch(test_inputs)
+    results = asyncio.run(analyze_batch_async(test_inputs))
     
     print("\n" + "="*50)
     print(f"📊 BATCH ANALYSIS COMPLETE - {len(results)} items processed")